@@ -15,8 +15,12 @@
 #   run -i "startup/00-startup.py <args>"
 
 
+import asyncio
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 
 import bluesky.preprocessors as bp
 from bluesky.run_engine import RunEngine
@@ -27,6 +31,15 @@ from megatron_controls.logger import ts_periodic_logging_decorator
 from megatron_controls.support import EpicsMotorGalil, ION_Pump_PS, register_custom_instructions
 from ophyd import EpicsSignal, EpicsSignalRO
 
+try:
+    # Optional Rust-based CA backend, which releases the GIL during EPICS I/O.
+    # Must be enabled before any EPICS device is constructed.
+    from ophyd_epicsrs import use_epicsrs
+except ImportError:
+    pass
+else:
+    use_epicsrs()
+
 
 def is_running_under_ipython():
     if hasattr(__builtins__, "__IPYTHON__"):
@@ -97,17 +110,20 @@ galil = EpicsMotorGalil(f"{prefix}", name="galil")
 galil_val = EpicsSignal(f"{prefix}.VAL", name="galil_val", auto_monitor=True)
 galil_rbv = EpicsSignalRO(f"{prefix}.RBV", name="galil_rbv", auto_monitor=True)
 
-galil.wait_for_connection()
-galil_val.wait_for_connection()
-galil_rbv.wait_for_connection()
-
 #prefix = "TEST{ION:PS}"
 prefix = "Depo{PS:1}"
 ION_Pump_PS = ION_Pump_PS(prefix, name="ION_Pump_PS")
 
 devices = {"galil": galil, "galil_val": galil_val, "galil_rbv": galil_rbv, "ION_Pump_PS": ION_Pump_PS}
 
+# Connect all devices concurrently, so the startup time is bounded by the slowest device
+with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+    list(executor.map(lambda device: device.wait_for_connection(), devices.values()))
+
 RE = RunEngine({})
+if sys.version_info >= (3, 12):
+    # Let tasks scheduled on the RunEngine loop (e.g. the periodic logger) start running immediately.
+    RE.loop.set_task_factory(asyncio.eager_task_factory)
 RE.waiting_hook = ProgressBarManager()
 
 register_custom_instructions(re=RE)
@@ -119,20 +135,67 @@ context.log_file_path = log_file_path
 interpreter = MegatronInterpreter(shared_context=context)
 
 
+def resolve_device_mapping(context):
+    """
+    Resolve the dotted device path of each mapped PV name to the signal object.
+    Returns the resolved signals and, for PV names whose device path could not be resolved,
+    the device path together with the raised exception.
+    """
+    pv_to_signal, unresolved_pvs = {}, {}
+    for pv_name, device_attr in context.device_mapping.items():
+        if not device_attr:
+            continue
+        try:
+            pv_to_signal[pv_name] = attrgetter(device_attr)(context.devices)
+        except AttributeError as ex:
+            unresolved_pvs[pv_name] = (device_attr, ex)
+    return pv_to_signal, unresolved_pvs
+
+
+pv_to_signal, unresolved_pvs = resolve_device_mapping(context)
+
+
+def disable_charval(signal):
+    """
+    Skip the pyepics string conversion of the value, which is otherwise computed on every monitor
+    update. Only applied to signals that are read as numbers. While disabled, ``as_string`` reads
+    of the signal return ``'None'``. Returns a callable that restores the conversion.
+    """
+    pv = getattr(signal, "_read_pv", None)
+    if pv is None or getattr(signal, "as_string", False) or not hasattr(pv, "_set_charval"):
+        return lambda: None
+    set_charval = pv._set_charval
+    pv._set_charval = lambda *args, **kwargs: None
+
+    def restore():
+        pv._set_charval = set_charval
+
+    return restore
+
+
 @bp.reset_positions_decorator([galil.velocity])
 @ts_periodic_logging_decorator(signals=context.logged_signals, log_file_path=log_file_path, period=1)
 def run_with_logging(script_name):
     script_path = os.path.join(context.script_dir, script_name)
     logged_pvs = interpreter.scan_script_for_logs(script_path)
-    for pv_name in logged_pvs:
-        device_attr = context.device_mapping.get(pv_name)
-        if not device_attr:
-            raise ValueError(f"Unknown PV name {pv_name}")
-        device = context.devices
-        for attr in device_attr.split("."):
-            device = getattr(device, attr)
-        context.logged_signals[pv_name] = device
-    yield from interpreter.execute_script(script_path)
+    restore_charval = []
+    try:
+        for pv_name in logged_pvs:
+            signal = pv_to_signal.get(pv_name)
+            if signal is None:
+                if pv_name in unresolved_pvs:
+                    device_attr, ex = unresolved_pvs[pv_name]
+                    raise ValueError(
+                        f"PV name {pv_name} maps to {device_attr!r}, which is not loaded: {ex}"
+                    ) from ex
+                raise ValueError(f"Unknown PV name {pv_name}")
+            restore_charval.append(disable_charval(signal))
+            context.logged_signals[pv_name] = signal
+        yield from interpreter.execute_script(script_path)
+    finally:
+        # Restore in reverse order, so a signal patched twice ends up with the original method
+        for restore in reversed(restore_charval):
+            restore()
 
 
 if not is_running_under_ipython() and __name__ == "__main__":
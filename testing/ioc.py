@@ -1,18 +1,20 @@
+import asyncio
 import numpy as np
 import time
 import textwrap
-import random
 
 from caproto import ChannelType
 from caproto.server import PVGroup, SubGroup, ioc_arg_parser, pvproperty, run
 
+_rng = np.random.default_rng()
+
 
 class IonPumpPS(PVGroup):
 
     Pwr_I = pvproperty(
         value=0,
         name="Pwr-I",
-        dtype=float,
+        dtype=ChannelType.FLOAT,
         read_only=True,
         doc="ION Power"
     )
@@ -20,7 +22,7 @@ class IonPumpPS(PVGroup):
     I_I = pvproperty(
         value=0,
         name="I-I",
-        dtype=float,
+        dtype=ChannelType.FLOAT,
         read_only=True,
         doc="ION Current"
     )
@@ -28,7 +30,7 @@ class IonPumpPS(PVGroup):
     E_I = pvproperty(
         value=0,
         name="E-I",
-        dtype=float,
+        dtype=ChannelType.FLOAT,
         read_only=True,
         doc="ION Voltage"
     )
@@ -36,7 +38,7 @@ class IonPumpPS(PVGroup):
     Rate_Arc_I = pvproperty(
         value=0,
         name="Rate:Arc-I",
-        dtype=float,
+        dtype=ChannelType.FLOAT,
         read_only=True,
         doc="ION Arc Rate"
     )
@@ -66,19 +68,22 @@ class IonPumpPS(PVGroup):
     @Enbl_Out_Cmd.scan(period=1.0)
     async def Enbl_Out_Cmd(self, instance, async_lib):
         enabled = instance.value == "Enable"
-        _I_I = random.gauss(10, 1) if enabled else 0
-        _E_I = random.gauss(400, 1) if enabled else 0
+        if enabled:
+            _I_I, _E_I, _Rate_Arc_I = _rng.normal((10, 400, 10), 1)
+        else:
+            _I_I = _E_I = _Rate_Arc_I = 0
         _Pwr_I = _I_I * _E_I
-        _Rate_Arc_I = random.gauss(10, 1) if enabled else 0
 
         _kwhr = 0.01 if enabled else 0
         _Cnt_Target_KwHr_RB = self.Cnt_Target_KwHr_RB.value + _kwhr
 
-        await self.I_I.write(value=_I_I)
-        await self.E_I.write(value=_E_I)
-        await self.Pwr_I.write(value=_Pwr_I)
-        await self.Rate_Arc_I.write(value=_Rate_Arc_I)
-        await self.Cnt_Target_KwHr_RB.write(value=_Cnt_Target_KwHr_RB)
+        await asyncio.gather(
+            self.I_I.write(value=_I_I),
+            self.E_I.write(value=_E_I),
+            self.Pwr_I.write(value=_Pwr_I),
+            self.Rate_Arc_I.write(value=_Rate_Arc_I),
+            self.Cnt_Target_KwHr_RB.write(value=_Cnt_Target_KwHr_RB),
+        )
 
 
 class MegatronSim(PVGroup):
@@ -99,6 +104,7 @@ if __name__ == "__main__":
     ioc_options, run_options = ioc_arg_parser(
         default_prefix="TEST",
         desc=textwrap.dedent(MegatronSim.__doc__),
+        supported_async_libs=("asyncio",),
     )
 
     ioc = MegatronSim(**ioc_options)